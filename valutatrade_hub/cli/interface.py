@@ -299,6 +299,7 @@ class InteractiveCLI:
             
             base_currency = 'USD'
             total_value = 0.0
+            rates = self.rate_manager.get_rates_to(portfolio.wallets, base_currency)
             
 
             print(f'{"Валюта":<10} {"Баланс":<15} {"Стоимость в USD":<20}')
@@ -306,14 +307,7 @@ class InteractiveCLI:
             
 
             for currency_code, wallet in portfolio.wallets.items():
-                if currency_code == base_currency:
-                    value = wallet.balance
-                else:
-                    try:
-                        rate = self.rate_manager.get_rate(currency_code, base_currency)
-                        value = wallet.balance * rate
-                    except Exception:
-                        value = 0.0
+                value = wallet.balance * rates.get(currency_code, 0.0)
                 
                 total_value += value
                 
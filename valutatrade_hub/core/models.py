@@ -1,34 +1,50 @@
 # valutatrade_hub/core/models.py
 import hashlib
+import hmac
 import secrets
 from datetime import datetime
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 
 from .currencies import get_currency
 from .exceptions import InsufficientFundsError
 
 
 class User:
+    __slots__ = ('_user_id', '_username', '_hashed_password', '_salt', '_salt_bytes',
+                 '_registration_date', '_registration_iso')
+    
     def __init__(self, user_id: int, username: str, password: str, 
                  salt: Optional[str] = None, 
-                 registration_date: Optional[datetime] = None):
+                 registration_date: Optional[Union[datetime, str]] = None):
         self._user_id = user_id
         self.username = username
         self._salt = salt or secrets.token_hex(8)
+        self._salt_bytes = self._salt.encode('utf-8')
         self._hashed_password = self._hash_password(password)
-        self._registration_date = registration_date or datetime.now()
+        
+        # Дата из users.json хранится строкой и разбирается только при обращении
+        if isinstance(registration_date, str):
+            self._registration_date = None
+            self._registration_iso = registration_date
+        else:
+            self._registration_date = registration_date or datetime.now()
+            self._registration_iso = self._registration_date.isoformat()
     
     def _hash_password(self, password: str) -> str:
         '''
         Хеширование пароля с солью
         '''
-        return hashlib.sha256((password + self._salt).encode()).hexdigest()
+        h = hashlib.sha256()
+        h.update(password.encode('utf-8'))
+        h.update(self._salt_bytes)
+        return h.hexdigest()
     
     def verify_password(self, password: str) -> bool:
         '''
         Проверка пароля
         '''
-        return self._hashed_password == self._hash_password(password)
+        return hmac.compare_digest(self._hashed_password, self._hash_password(password))
     
     def change_password(self, new_password: str) -> None:
         '''
@@ -44,7 +60,19 @@ class User:
         '''
         return (f'User ID: {self._user_id}, '
                 f'Username: {self._username}, '
-                f'Registered: {self._registration_date.strftime('%Y-%m-%d %H:%M')}')
+                f'Registered: {self.registration_date.strftime('%Y-%m-%d %H:%M')}')
+    
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        Представление пользователя для сохранения в users.json
+        '''
+        return {
+            'user_id': self._user_id,
+            'username': self._username,
+            'hashed_password': self._hashed_password,
+            'salt': self._salt,
+            'registration_date': self._registration_iso
+        }
     
     @property
     def user_id(self) -> int:
@@ -62,9 +90,13 @@ class User:
     
     @property
     def registration_date(self) -> datetime:
+        if self._registration_date is None:
+            self._registration_date = datetime.fromisoformat(self._registration_iso)
         return self._registration_date
 
 class Wallet:
+    __slots__ = ('currency_code', '_balance')
+    
     def __init__(self, currency_code: str, balance: float = 0.0):
         self.currency_code = currency_code.upper()
         self._balance = balance
@@ -75,7 +107,7 @@ class Wallet:
         '''
         if amount <= 0:
             raise ValueError('Ошибка: Сумма пополнения должна быть положительной')
-        self.balance += amount
+        self._balance += amount
     
     def withdraw(self, amount: float) -> None:
         '''
@@ -85,7 +117,7 @@ class Wallet:
             raise ValueError('Ошибка: Сумма снятия должна быть положительной')
         if amount > self._balance:
             raise InsufficientFundsError(self._balance, amount, self.currency_code)
-        self.balance -= amount
+        self._balance -= amount
     
     def get_balance_info(self) -> str:
         '''
@@ -93,6 +125,12 @@ class Wallet:
         '''
         return f'{self.currency_code}: {self._balance:.2f}'
     
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+        Представление кошелька для сохранения в portfolios.json
+        '''
+        return {'balance': self._balance}
+    
     @property
     def balance(self) -> float:
         return self._balance
@@ -105,9 +143,12 @@ class Wallet:
         
 
 class Portfolio:
+    __slots__ = ('_user_id', '_wallets', '_wallets_view')
+    
     def __init__(self, user_id: int, wallets: Optional[Dict[str, Wallet]] = None):
         self._user_id = user_id
         self._wallets = wallets or {}
+        self._wallets_view = MappingProxyType(self._wallets)
     
     def add_currency(self, currency_code: str) -> None:
         '''
@@ -124,16 +165,17 @@ class Portfolio:
         Получение кошелька по коду валюты (создает новый если не существует)
         '''
         currency_code = currency_code.upper()
-        if currency_code not in self._wallets:
-            self._wallets[currency_code] = Wallet(currency_code, 0.0)
-        return self._wallets[currency_code]
+        wallet = self._wallets.get(currency_code)
+        if wallet is None:
+            wallet = self._wallets[currency_code] = Wallet(currency_code, 0.0)
+        return wallet
 
     @property
     def user_id(self) -> int:
         return self._user_id
     
     @property
-    def wallets(self) -> Dict[str, Wallet]:
-        return self._wallets.copy()
+    def wallets(self) -> Mapping[str, Wallet]:
+        return self._wallets_view
         
         
\ No newline at end of file
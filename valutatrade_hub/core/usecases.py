@@ -1,6 +1,6 @@
 # valutatrade_hub/core/usecases.py
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from valutatrade_hub.decorators import log_action
 
@@ -10,7 +10,6 @@ from .currencies import get_currency
 from .exceptions import (
     AuthenticationError,
     CurrencyNotFoundError,
-    InsufficientFundsError,
     UsernamePasswordError,
     UsernameTakenError,
     UserNotFoundError,
@@ -44,13 +43,7 @@ class UserManager:
 
             user = User(user_id, username, password)
             
-            user_data = {
-                'user_id': user.user_id,
-                'username': user.username,
-                'hashed_password': user._hashed_password,
-                'salt': user._salt,
-                'registration_date': user.registration_date.isoformat()
-            }
+            user_data = user.to_dict()
             
             def update_users(users):
                 users.append(user_data)
@@ -91,7 +84,8 @@ class UserManager:
             user_data['user_id'],
             user_data['username'],
             password,
-            user_data['salt']
+            user_data['salt'],
+            user_data['registration_date']
         )
         
         return self.current_user
@@ -138,15 +132,11 @@ class PortfolioManager:
         cost_in_base_currency = amount * rate
         
         base_wallet = portfolio.wallets[base_currency]
-        if base_wallet.balance < cost_in_base_currency:
-            raise InsufficientFundsError
-        
         old_base_balance = base_wallet.balance
         base_wallet.withdraw(cost_in_base_currency)
         
         target_wallet = portfolio.get_wallet(currency_code)
         old_target_balance = target_wallet.balance
-        old_base_balance = base_wallet.balance
         target_wallet.deposit(amount)
         
         self.save_portfolio(portfolio)
@@ -176,15 +166,11 @@ class PortfolioManager:
         
         portfolio = self.get_user_portfolio(user_id)
         
-        if currency_code not in portfolio.wallets:
+        wallet = portfolio.wallets.get(currency_code)
+        if wallet is None:
             raise ValueError(f'Ошибка: Не существует кошелька "{currency_code}"')
-        
-        wallet = portfolio.wallets[currency_code]
         old_balance = wallet.balance
         
-        if amount > wallet.balance:
-            raise InsufficientFundsError
-        
         rate_manager = RateManager()
         rate = rate_manager.get_rate(currency_code, base_currency)
         revenue_in_base_currency = amount * rate
@@ -228,22 +214,17 @@ class PortfolioManager:
         '''
         Сохранение портфеля
         '''
+        wallets_data = {
+            currency_code: wallet.to_dict()
+            for currency_code, wallet in portfolio.wallets.items()
+        }
+        
         def update_portfolios(portfolios_data):
             for i, portfolio_data in enumerate(portfolios_data):
                 if portfolio_data['user_id'] == portfolio.user_id:
-                    wallets_data = {}
-                    for currency_code, wallet in portfolio.wallets.items():
-                        wallets_data[currency_code] = {
-                            'balance': wallet.balance
-                        }
                     portfolios_data[i]['wallets'] = wallets_data
                     break
             else:
-                wallets_data = {}
-                for currency_code, wallet in portfolio.wallets.items():
-                    wallets_data[currency_code] = {
-                        'balance': wallet.balance
-                    }
                 portfolios_data.append({
                     'user_id': portfolio.user_id,
                     'wallets': wallets_data
@@ -299,24 +280,49 @@ class RateManager:
         if from_currency == to_currency:
             print('Ошибка: Данной валюты не существует')
         
+        rates_data = db.load_data('rates') or {'rates': {}, 'timestamp': None}
+        rate = self._find_rate(rates_data.get('rates', {}), from_currency, to_currency)
+        if rate is not None:
+            return rate
+        
+        raise CurrencyNotFoundError(
+           f'Ошибка: Курс для пары {from_currency}/{to_currency} не найден. '
+           f'Проверьте доступные валюты или обновите данные.'
+        )
+    
+    def get_rates_to(self, currency_codes: Iterable[str], to_currency: str) -> Dict[str, float]:
+        '''
+        Получение курсов нескольких валют к одной валюте за одно чтение rates.json
+        (валюты без известного курса в результат не попадают)
+        '''
         rates_data = db.load_data('rates') or {'rates': {}, 'timestamp': None}
         rates = rates_data.get('rates', {})
         
+        result = {}
+        for currency_code in currency_codes:
+            if currency_code == to_currency:
+                result[currency_code] = 1.0
+                continue
+            rate = self._find_rate(rates, currency_code, to_currency)
+            if rate is not None:
+                result[currency_code] = rate
+        return result
+    
+    @staticmethod
+    def _find_rate(rates: Dict[str, float], from_currency: str,
+                   to_currency: str) -> Optional[float]:
+        '''
+        Поиск прямого или обратного курса в словаре пар
+        '''
         direct_pair = f'{from_currency}_{to_currency}'
         if direct_pair in rates:
-            rate = rates[direct_pair]
-            return rate
+            return rates[direct_pair]
         
         reverse_pair = f'{to_currency}_{from_currency}'
         if reverse_pair in rates:
-            reverse_rate = rates[reverse_pair]
-            rate = 1 / reverse_rate
-            return rate
+            return 1 / rates[reverse_pair]
         
-        raise CurrencyNotFoundError(
-           f'Ошибка: Курс для пары {from_currency}/{to_currency} не найден. '
-           f'Проверьте доступные валюты или обновите данные.'
-        )
+        return None
       
     def get_rates_age(self) -> str:
         '''